@@ -1,20 +1,58 @@
 import json
 import sys
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
-if len(sys.argv) != 3:
-    print("Usage: python validate_jsonld.py <data.json> <schema.json>")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is None:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # Fall back to the stdlib parser: it accepts inputs orjson rejects
+        # (NaN, very large integers) and reports errors with line/column.
+        return json.loads(raw)
+
+
+if len(sys.argv) < 3:
+    print("Usage: python validate_jsonld.py <data.json> [<data.json> ...] <schema.json>")
     sys.exit(1)
 
-with open(sys.argv[1]) as f:
-    data = json.load(f)
-with open(sys.argv[2]) as f:
-    schema = json.load(f)
+data_paths = sys.argv[1:-1]
+schema = load_json(sys.argv[-1])
 
-try:
-    validate(instance=data, schema=schema)
-    print("Validation successful!")
-except ValidationError as e:
-    print("Validation failed:")
-    print(e)
-    sys.exit(2) 
\ No newline at end of file
+# Check the schema and build its validator once, then reuse it for every data file.
+cls = validator_for(schema)
+cls.check_schema(schema)
+validator = cls(schema)
+
+failed = False
+for data_path in data_paths:
+    prefix = f"{data_path}: " if len(data_paths) > 1 else ""
+    try:
+        data = load_json(data_path)
+    except (OSError, ValueError) as e:
+        # Report an unreadable file once and move on; there is nothing to validate.
+        print(f"{prefix}Could not load JSON:")
+        print(e)
+        failed = True
+        continue
+
+    # is_valid() stops at the first error; only collect errors for reporting on failure.
+    if validator.is_valid(data):
+        print(f"{prefix}Validation successful!")
+    else:
+        print(f"{prefix}Validation failed:")
+        print(best_match(validator.iter_errors(data)))
+        failed = True
+
+if failed:
+    sys.exit(2)